@@ -12,7 +12,8 @@ from app.services.matching_service import MatchingService
 from app.schemas.matching import (
     FieldMatchRequest,
     FieldMatchResponse,
-    FieldMatchResult
+    FieldMatchResult,
+    SUPPORTED_FIELD_TYPES
 )
 
 router = APIRouter()
@@ -54,7 +55,7 @@ async def match_resume_fields(
         success=True,
         matches=matches,
         total_fields=len(request.form_fields),
-        matched_fields=len([m for m in matches if m.matched_value]),
+        matched_fields=sum(1 for m in matches if m.matched_value),
         error_message=None
     )
 
@@ -110,57 +111,4 @@ async def get_supported_field_types():
     """
     获取支持的表单字段类型
     """
-    return {
-        "field_types": [
-            {
-                "type": "text",
-                "name": "文本输入",
-                "description": "单行文本输入框"
-            },
-            {
-                "type": "textarea",
-                "name": "多行文本",
-                "description": "多行文本输入框"
-            },
-            {
-                "type": "select",
-                "name": "下拉选择",
-                "description": "下拉选择器，需要提供选项"
-            },
-            {
-                "type": "radio",
-                "name": "单选按钮",
-                "description": "单选按钮组"
-            },
-            {
-                "type": "checkbox",
-                "name": "复选框",
-                "description": "复选框"
-            },
-            {
-                "type": "date",
-                "name": "日期",
-                "description": "日期选择器"
-            },
-            {
-                "type": "email",
-                "name": "邮箱",
-                "description": "邮箱输入框"
-            },
-            {
-                "type": "tel",
-                "name": "电话",
-                "description": "电话号码输入框"
-            },
-            {
-                "type": "number",
-                "name": "数字",
-                "description": "数字输入框"
-            },
-            {
-                "type": "url",
-                "name": "网址",
-                "description": "URL输入框"
-            }
-        ]
-    }
+    return {"field_types": SUPPORTED_FIELD_TYPES}
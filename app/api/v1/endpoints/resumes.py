@@ -191,13 +191,6 @@ async def get_preset_fields():
     """
     获取预设字段模板
     """
-    from app.schemas.resume import get_preset_fields, get_preset_fields_by_category, COMMON_RESUME_FIELDS
-
-    return {
-        "all_fields": [field.model_dump() for field in get_preset_fields()],
-        "categories": list(COMMON_RESUME_FIELDS.keys()),
-        "fields_by_category": {
-            category: [field.model_dump() for field in get_preset_fields_by_category(category)]
-            for category in COMMON_RESUME_FIELDS.keys()
-        }
-    }
+    from app.schemas.resume import get_preset_fields_template
+
+    return get_preset_fields_template()
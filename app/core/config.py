@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     # AI Service (Dashscope - 阿里千问)
     DASHSCOPE_API_KEY: Optional[str] = None
     AI_MODEL: str = "qwen-turbo"
+    AI_MATCH_CACHE_SIZE: int = 256  # 相同输入的匹配结果缓存条数，0表示关闭
     
     # Activation Code Settings
     DEFAULT_ACTIVATION_USES: int = 5
@@ -61,3 +61,58 @@ class FieldTypeInfo(BaseModel):
 class SupportedFieldTypesResponse(BaseModel):
     """支持的字段类型响应"""
     field_types: List[FieldTypeInfo] = Field(..., description="支持的字段类型列表")
+
+
+# 支持的表单字段类型
+SUPPORTED_FIELD_TYPES = [
+    {
+        "type": "text",
+        "name": "文本输入",
+        "description": "单行文本输入框"
+    },
+    {
+        "type": "textarea",
+        "name": "多行文本",
+        "description": "多行文本输入框"
+    },
+    {
+        "type": "select",
+        "name": "下拉选择",
+        "description": "下拉选择器，需要提供选项"
+    },
+    {
+        "type": "radio",
+        "name": "单选按钮",
+        "description": "单选按钮组"
+    },
+    {
+        "type": "checkbox",
+        "name": "复选框",
+        "description": "复选框"
+    },
+    {
+        "type": "date",
+        "name": "日期",
+        "description": "日期选择器"
+    },
+    {
+        "type": "email",
+        "name": "邮箱",
+        "description": "邮箱输入框"
+    },
+    {
+        "type": "tel",
+        "name": "电话",
+        "description": "电话号码输入框"
+    },
+    {
+        "type": "number",
+        "name": "数字",
+        "description": "数字输入框"
+    },
+    {
+        "type": "url",
+        "name": "网址",
+        "description": "URL输入框"
+    }
+]
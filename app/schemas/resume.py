@@ -3,6 +3,7 @@
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from pydantic import BaseModel, Field
@@ -124,3 +125,16 @@ def get_preset_fields_by_category(category: str) -> List[PresetFieldSchema]:
     if category in COMMON_RESUME_FIELDS:
         return [PresetFieldSchema(**field) for field in COMMON_RESUME_FIELDS[category]]
     return []
+
+
+@lru_cache(maxsize=1)
+def get_preset_fields_template() -> Dict[str, Any]:
+    """获取预设字段模板接口的响应数据（模板为静态数据，只构建一次）"""
+    return {
+        "all_fields": [field.model_dump() for field in get_preset_fields()],
+        "categories": list(COMMON_RESUME_FIELDS.keys()),
+        "fields_by_category": {
+            category: [field.model_dump() for field in get_preset_fields_by_category(category)]
+            for category in COMMON_RESUME_FIELDS.keys()
+        }
+    }
@@ -2,56 +2,26 @@
 AI服务模块 - 集成阿里千问大模型
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
-from dashscope import Generation
+from fastapi.concurrency import run_in_threadpool
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-
-class AIService:
-    """AI服务类"""
-
-    @staticmethod
-    def _build_field_matching_prompt(
-        resume_text: str,
-        form_fields: List[Dict[str, Any]]
-    ) -> str:
-        """构建字段匹配的提示词"""
-
-        # 格式化表单字段信息
-        fields_info = []
-        for field in form_fields:
-            field_type = field.get('type', 'text')
-            field_name = field.get('name', '')
-            field_label = field.get('label', '')
-            field_placeholder = field.get('placeholder', '')
-            field_options = field.get('options', [])
-
-            field_desc = f"字段名: {field_name}"
-            if field_label:
-                field_desc += f", 标签: {field_label}"
-            if field_placeholder:
-                field_desc += f", 占位符: {field_placeholder}"
-            field_desc += f", 类型: {field_type}"
-
-            if field_options:
-                field_desc += f", 选项: {field_options}"
-
-            fields_info.append(field_desc)
-
-        prompt = f"""
+# 字段匹配提示词中的固定部分，模块加载时构建一次
+_FIELD_MATCHING_PROMPT_HEAD = """
 你是一个专业的简历信息提取和表单填写助手。
 
 请根据以下简历信息，为给定的表单字段提供合适的填写内容。
 
 【简历信息】：
-{resume_text}
+"""
 
-【表单字段】：
-{chr(10).join(f'{i+1}. {info}' for i, info in enumerate(fields_info))}
+_FIELD_MATCHING_PROMPT_TAIL = """
 
 【任务要求】：
 1. 仔细分析简历信息，理解候选人的背景
@@ -66,15 +36,154 @@ class AIService:
 请直接返回一个JSON数组，包含所有匹配结果，不要包含任何其他内容：
 
 [
-    {{
+    {
         "field_name": "字段名",
         "field_type": "字段类型",
         "matched_value": "匹配的值"
-    }}
+    }
 ]
 """
+
+_json_decoder = json.JSONDecoder()
+
+# 进程内LRU缓存：提示词哈希 -> 已校验的匹配结果
+_match_cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
+
+class _JsonArrayTracker:
+    """跟踪流式输出中的括号深度，判断顶层JSON数组是否已经闭合"""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """处理一段增量输出，顶层数组闭合时返回True"""
+        for char in text:
+            if not self.started:
+                if char == '[':
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char in '[{':
+                self.depth += 1
+            elif char in ']}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+
+        return False
+
+
+class AIService:
+    """AI服务类"""
+
+    @staticmethod
+    def _build_field_matching_prompt(
+        resume_text: str,
+        form_fields: List[Dict[str, Any]]
+    ) -> str:
+        """构建字段匹配的提示词"""
+
+        # 格式化表单字段信息
+        fields_info = []
+        for i, field in enumerate(form_fields, 1):
+            parts = [f"{i}. 字段名: {field.get('name', '')}"]
+
+            field_label = field.get('label', '')
+            if field_label:
+                parts.append(f"标签: {field_label}")
+            field_placeholder = field.get('placeholder', '')
+            if field_placeholder:
+                parts.append(f"占位符: {field_placeholder}")
+            parts.append(f"类型: {field.get('type', 'text')}")
+
+            field_options = field.get('options', [])
+            if field_options:
+                parts.append(f"选项: {field_options}")
+
+            fields_info.append(", ".join(parts))
+
+        prompt = (
+            f"{_FIELD_MATCHING_PROMPT_HEAD}{resume_text}\n\n"
+            f"【表单字段】：\n{chr(10).join(fields_info)}"
+            f"{_FIELD_MATCHING_PROMPT_TAIL}"
+        )
         return prompt
 
+    @staticmethod
+    def _call_generation(prompt: str) -> Tuple[int, str]:
+        """
+        以流式方式调用千问，收到完整的JSON数组后立即停止读取
+
+        Returns:
+            Tuple[status_code, output_text]
+        """
+        # dashscope依赖较重，仅在实际调用时导入
+        from dashscope import Generation
+
+        responses = Generation.call(
+            model=settings.AI_MODEL,
+            prompt=prompt,
+            api_key=settings.DASHSCOPE_API_KEY,
+            max_tokens=2000,
+            temperature=0.1,  # 较低的温度以获得更稳定的输出
+            top_p=0.8,
+            stream=True,
+            incremental_output=True
+        )
+
+        tracker = _JsonArrayTracker()
+        chunks = []
+        try:
+            for response in responses:
+                if response.status_code != 200:
+                    return response.status_code, ""
+
+                text = response.output.text or ""
+                chunks.append(text)
+                if tracker.feed(text):
+                    break
+        finally:
+            close = getattr(responses, "close", None)
+            if close is not None:
+                close()
+
+        return 200, "".join(chunks)
+
+    @staticmethod
+    def _get_cached_matches(cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """读取缓存的匹配结果"""
+        matches = _match_cache.get(cache_key)
+        if matches is None:
+            return None
+
+        _match_cache.move_to_end(cache_key)
+        return [dict(match) for match in matches]
+
+    @staticmethod
+    def _cache_matches(cache_key: str, matches: List[Dict[str, Any]]) -> None:
+        """写入匹配结果缓存，超出容量时淘汰最久未使用的条目"""
+        if settings.AI_MATCH_CACHE_SIZE <= 0:
+            return
+
+        _match_cache[cache_key] = [dict(match) for match in matches]
+        _match_cache.move_to_end(cache_key)
+        while len(_match_cache) > settings.AI_MATCH_CACHE_SIZE:
+            _match_cache.popitem(last=False)
+
     @staticmethod
     async def match_form_fields(
         resume_text: str,
@@ -90,43 +199,48 @@ class AIService:
         Returns:
             Tuple[success, matches, error_message]
         """
+        # 没有待匹配字段时无需调用AI
+        if not form_fields:
+            return True, [], ""
+
         try:
             # 构建提示词
             prompt = AIService._build_field_matching_prompt(resume_text, form_fields)
 
-            logger.info(f"AI字段匹配开始，简历长度: {len(resume_text)}, 字段数量: {len(form_fields)}")
+            # 相同简历与表单的结果直接复用，避免重复调用AI
+            cache_key = hashlib.sha256(
+                f"{settings.AI_MODEL}\n{prompt}".encode("utf-8")
+            ).hexdigest()
+            cached_matches = AIService._get_cached_matches(cache_key)
+            if cached_matches is not None:
+                logger.info("AI字段匹配命中缓存，匹配结果数量: %d", len(cached_matches))
+                return True, cached_matches, ""
+
+            logger.info("AI字段匹配开始，简历长度: %d, 字段数量: %d", len(resume_text), len(form_fields))
 
-            # 调用阿里千问API
-            response = Generation.call(
-                model=settings.AI_MODEL,
-                prompt=prompt,
-                api_key=settings.DASHSCOPE_API_KEY,
-                max_tokens=2000,
-                temperature=0.1,  # 较低的温度以获得更稳定的输出
-                top_p=0.8
+            # 调用阿里千问API（同步阻塞调用，放到线程池中执行以免阻塞事件循环）
+            status_code, ai_output = await run_in_threadpool(
+                AIService._call_generation, prompt
             )
 
             # 检查响应状态
-            if response.status_code != 200:
-                error_msg = f"AI API调用失败，状态码: {response.status_code}"
+            if status_code != 200:
+                error_msg = f"AI API调用失败，状态码: {status_code}"
                 logger.error(error_msg)
                 return False, [], error_msg
 
             # 解析响应内容
-            ai_output = response.output.text.strip()
-            logger.debug(f"AI原始输出: {ai_output}")
+            ai_output = ai_output.strip()
+            logger.debug("AI原始输出: %s", ai_output)
 
             # 尝试解析JSON
             try:
-                # 提取JSON部分（去除可能的额外文本）
+                # 从第一个'['开始直接解码JSON数组，忽略前后可能的额外文本
                 json_start = ai_output.find('[')
-                json_end = ai_output.rfind(']') + 1
-
-                if json_start == -1 or json_end == 0:
+                if json_start == -1:
                     raise ValueError("AI输出中未找到有效的JSON数组格式")
 
-                json_content = ai_output[json_start:json_end]
-                matches = json.loads(json_content)
+                matches, _ = _json_decoder.raw_decode(ai_output, json_start)
 
                 # 验证匹配结果格式
                 validated_matches = []
@@ -141,12 +255,14 @@ class AIService:
                     }
                     validated_matches.append(validated_match)
 
-                logger.info(f"AI字段匹配成功，匹配结果数量: {len(validated_matches)}")
+                AIService._cache_matches(cache_key, validated_matches)
+
+                logger.info("AI字段匹配成功，匹配结果数量: %d", len(validated_matches))
                 return True, validated_matches, ""
 
             except (json.JSONDecodeError, ValueError, KeyError) as e:
                 error_msg = f"AI输出解析失败: {str(e)}"
-                logger.error(f"{error_msg}, 原始输出: {ai_output}")
+                logger.error("%s, 原始输出: %s", error_msg, ai_output)
                 return False, [], error_msg
 
         except Exception as e:
@@ -19,6 +19,13 @@ from app.schemas.matching import (
 
 logger = logging.getLogger(__name__)
 
+# 允许匹配的表单字段类型
+VALID_FIELD_TYPES = frozenset({
+    'text', 'select', 'date', 'email', 'tel', 'number',
+    'textarea', 'radio', 'checkbox', 'url', 'password',
+    'time', 'datetime-local', 'month', 'week', 'file'
+})
+
 
 class MatchingService:
     """智能字段匹配服务类"""
@@ -58,7 +65,7 @@ class MatchingService:
             # 转换表单字段为字典格式
             form_fields_dict = [field.model_dump() for field in form_fields]
 
-            logger.info(f"开始匹配简历字段，用户: {user_id}, 简历: {resume_id}, 字段数: {len(form_fields)}")
+            logger.info("开始匹配简历字段，用户: %s, 简历: %s, 字段数: %d", user_id, resume_id, len(form_fields))
 
             # 调用AI服务进行匹配
             ai_success, ai_matches, ai_error = await AIService.match_form_fields(
@@ -66,7 +73,7 @@ class MatchingService:
             )
 
             if not ai_success:
-                logger.error(f"AI匹配失败: {ai_error}")
+                logger.error("AI匹配失败: %s", ai_error)
                 return False, [], ai_error
 
             # 转换AI匹配结果为Pydantic模型
@@ -76,7 +83,7 @@ class MatchingService:
                     match_result = FieldMatchResult(**match_data)
                     matches.append(match_result)
                 except Exception as e:
-                    logger.warning(f"字段匹配结果格式错误: {e}, 数据: {match_data}")
+                    logger.warning("字段匹配结果格式错误: %s, 数据: %s", e, match_data)
                     continue
 
             # 记录使用日志
@@ -88,9 +95,9 @@ class MatchingService:
             # 扣减激活次数
             use_success, use_message = await ActivationService.use_activation(db, user_id)
             if not use_success:
-                logger.warning(f"激活次数扣减失败: {use_message}")
+                logger.warning("激活次数扣减失败: %s", use_message)
 
-            logger.info(f"字段匹配完成，匹配数量: {len(matches)}")
+            logger.info("字段匹配完成，匹配数量: %d", len(matches))
             return True, matches, ""
 
         except Exception as e:
@@ -120,7 +127,7 @@ class MatchingService:
             await db.commit()
 
         except Exception as e:
-            logger.error(f"记录使用日志失败: {str(e)}")
+            logger.error("记录使用日志失败: %s", e)
             # 不影响主流程，继续执行
 
     @staticmethod
@@ -140,17 +147,11 @@ class MatchingService:
         if len(form_fields) > 50:  # 限制字段数量
             return False, "表单字段数量不能超过50个"
 
-        valid_field_types = {
-            'text', 'select', 'date', 'email', 'tel', 'number',
-            'textarea', 'radio', 'checkbox', 'url', 'password',
-            'time', 'datetime-local', 'month', 'week', 'file'
-        }
-
         for i, field in enumerate(form_fields):
             if not field.name.strip():
                 return False, f"第{i+1}个字段名称不能为空"
 
-            if field.type not in valid_field_types:
+            if field.type not in VALID_FIELD_TYPES:
                 return False, f"第{i+1}个字段类型'{field.type}'不支持"
 
             if field.type == 'select' and not field.options:
@@ -173,7 +174,7 @@ class MatchingService:
         Returns:
             格式化的结果字典
         """
-        matched_fields = len([m for m in matches if m.matched_value])
+        matched_fields = sum(1 for m in matches if m.matched_value)
         match_rate = matched_fields / total_fields if total_fields > 0 else 0
 
         return {
@@ -4,6 +4,7 @@
 
 from typing import Optional
 from uuid import UUID
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User, UserStatus
@@ -22,8 +23,10 @@ class UserService:
         if existing_user:
             raise ValueError("邮箱已存在")
 
-        # 创建新用户
-        hashed_password = get_password_hash(user_create.password)
+        # 创建新用户（bcrypt为CPU密集操作，放到线程池中执行以免阻塞事件循环）
+        hashed_password = await run_in_threadpool(
+            get_password_hash, user_create.password
+        )
         db_user = User(
             email=user_create.email,
             password_hash=hashed_password,
@@ -58,7 +61,9 @@ class UserService:
         if not user:
             return None
 
-        if not verify_password(password, user.password_hash):
+        if not await run_in_threadpool(
+            verify_password, password, user.password_hash
+        ):
             return None
 
         if user.status != UserStatus.ACTIVE:
@@ -78,7 +83,9 @@ class UserService:
         update_data = user_update.model_dump(exclude_unset=True)
 
         if "password" in update_data:
-            update_data["password_hash"] = get_password_hash(update_data["password"])
+            update_data["password_hash"] = await run_in_threadpool(
+                get_password_hash, update_data["password"]
+            )
             del update_data["password"]
 
         for field, value in update_data.items():
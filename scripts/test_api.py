@@ -6,8 +6,10 @@ API接口测试脚本
 
 import asyncio
 import json
+import os
 import sys
-import requests
+import httpx
+from functools import lru_cache
 from pathlib import Path
 from uuid import UUID, uuid4
 from typing import Dict, Any, Optional, List
@@ -15,6 +17,72 @@ from typing import Dict, Any, Optional, List
 # 基本配置
 API_BASE_URL = "http://localhost:8000/api/v1"
 ACCESS_TOKEN = None  # 将在登录后设置
+HTTP_CLIENT = None  # 将在main中创建，所有请求复用同一个连接池
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"  # 设置TEST_VERBOSE=1时打印完整响应内容
+
+# 连接池：并发请求的连接全部保持长连接，空闲连接在等待AI匹配期间不过期
+HTTP_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0
+)
+
+# 测试数据
+TEST_RESUME_DATA = {
+    "title": "测试简历",
+    "fields": {
+        "name": "张三",
+        "email": "zhangsan@example.com",
+        "phone": "13800138000",
+        "address": "北京市朝阳区",
+        "self_introduction": "具有5年Python开发经验的软件工程师",
+        "university": "清华大学",
+        "degree": "本科",
+        "major": "计算机科学与技术",
+        "education_start_date": "2015-09",
+        "education_end_date": "2019-07",
+        "current_company": "阿里巴巴",
+        "current_position": "Python开发工程师",
+        "work_start_date": "2019-07",
+        "work_end_date": "2024-01",
+        "responsibilities": "开发Web应用，优化数据库性能",
+        "achievements": "提升系统性能30%",
+        "programming_languages": "Python",
+        "frameworks": "Django"
+    }
+}
+
+TEST_FORM_FIELDS = [
+    {
+        "name": "fullName",
+        "type": "text",
+        "label": "姓名",
+        "placeholder": "请输入您的姓名"
+    },
+    {
+        "name": "email",
+        "type": "email",
+        "label": "邮箱",
+        "placeholder": "请输入邮箱地址"
+    },
+    {
+        "name": "phone",
+        "type": "tel",
+        "label": "联系电话"
+    },
+    {
+        "name": "education",
+        "type": "select",
+        "label": "学历",
+        "options": ["高中", "大专", "本科", "硕士", "博士"]
+    },
+    {
+        "name": "workYears",
+        "type": "select",
+        "label": "工作年限",
+        "options": ["应届毕业生", "1-3年", "3-5年", "5-10年", "10年以上"]
+    }
+]
 
 
 def print_header(title):
@@ -25,48 +93,51 @@ def print_header(title):
 
 
 def print_response(response, show_content=True):
-    """打印响应信息"""
+    """打印响应信息，并返回解析后的JSON内容（非JSON响应返回None）"""
     print(f"状态码: {response.status_code}")
+
+    try:
+        content = response.json()
+    except ValueError:
+        content = None
+
     if show_content:
-        try:
-            content = response.json()
-            print(f"响应内容: {json.dumps(content, ensure_ascii=False, indent=2)}")
-        except:
+        if content is None:
             print(f"响应内容: {response.text[:200]}...")
+        elif VERBOSE or response.status_code >= 400:
+            # 完整格式化输出，失败的请求始终打印全部内容便于排查
+            print(f"响应内容: {json.dumps(content, ensure_ascii=False, indent=2)}")
+        elif isinstance(content, dict):
+            print(f"响应内容: dict, 键: {list(content)[:5]}")
+        elif isinstance(content, list):
+            print(f"响应内容: list, 长度: {len(content)}")
+        else:
+            print(f"响应内容: {content}")
 
+    return content
 
-def api_request(method, endpoint, data=None, token=None, params=None):
-    """发送API请求"""
-    url = f"{API_BASE_URL}/{endpoint}"
-    headers = {}
 
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+@lru_cache(maxsize=8)
+def auth_headers(token):
+    """构建认证请求头（同一token只构建一次）"""
+    return {"Authorization": f"Bearer {token}"}
 
-    if data is not None:
-        headers["Content-Type"] = "application/json"
-        response = requests.request(
-            method=method,
-            url=url,
-            json=data,
-            headers=headers,
-            params=params
-        )
-    else:
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params
-        )
+
+async def api_request(method, endpoint, data=None, token=None, params=None):
+    """发送API请求（endpoint为相对API_BASE_URL的路径，json请求头由httpx自动设置）"""
+    response = await HTTP_CLIENT.request(
+        method=method,
+        url=endpoint,
+        json=data,
+        headers=auth_headers(token) if token else None,
+        params=params
+    )
 
     return response
 
 
-def test_register_user():
+async def test_register_user():
     """测试用户注册"""
-    print_header("测试用户注册")
-
     # 生成随机邮箱以避免冲突
     email = f"test_{uuid4().hex[:8]}@example.com"
     data = {
@@ -74,7 +145,8 @@ def test_register_user():
         "password": "testpass123"
     }
 
-    response = api_request("POST", "auth/register", data)
+    response = await api_request("POST", "auth/register", data)
+    print_header("测试用户注册")
     print_response(response)
 
     if response.status_code in [200, 201]:
@@ -85,20 +157,19 @@ def test_register_user():
         return None
 
 
-def test_login(email, password="testpass123"):
+async def test_login(email, password="testpass123"):
     """测试用户登录"""
-    print_header("测试用户登录")
-
     data = {
         "email": email,
         "password": password
     }
 
-    response = api_request("POST", "auth/login", data)
-    print_response(response)
+    response = await api_request("POST", "auth/login", data)
+    print_header("测试用户登录")
+    content = print_response(response)
 
     if response.status_code == 200:
-        token = response.json().get("access_token")
+        token = content.get("access_token")
         print(f"✅ 用户登录成功，获取到token")
         return token
     else:
@@ -106,20 +177,19 @@ def test_login(email, password="testpass123"):
         return None
 
 
-def test_create_activation_code(token):
+async def test_create_activation_code(token):
     """测试创建激活码"""
-    print_header("测试创建激活码")
-
     data = {
         "code": f"TEST{uuid4().hex[:8].upper()}",
         "total_uses": 10
     }
 
-    response = api_request("POST", "activations/codes", data, token)
-    print_response(response)
+    response = await api_request("POST", "activations/codes", data, token)
+    print_header("测试创建激活码")
+    content = print_response(response)
 
     if response.status_code == 200:
-        code = response.json().get("code")
+        code = content.get("code")
         print(f"✅ 激活码创建成功: {code}")
         return code
     else:
@@ -127,15 +197,14 @@ def test_create_activation_code(token):
         return None
 
 
-def test_activate_user(token, code):
+async def test_activate_user(token, code):
     """测试激活用户"""
-    print_header("测试激活用户")
-
     data = {
         "code": code
     }
 
-    response = api_request("POST", "activations/activate", data, token)
+    response = await api_request("POST", "activations/activate", data, token)
+    print_header("测试激活用户")
     print_response(response)
 
     if response.status_code == 200:
@@ -146,39 +215,14 @@ def test_activate_user(token, code):
         return False
 
 
-def test_create_resume(token):
+async def test_create_resume(token):
     """测试创建简历"""
+    response = await api_request("POST", "resumes", TEST_RESUME_DATA, token)
     print_header("测试创建简历")
-
-    data = {
-        "title": "测试简历",
-        "fields": {
-            "name": "张三",
-            "email": "zhangsan@example.com",
-            "phone": "13800138000",
-            "address": "北京市朝阳区",
-            "self_introduction": "具有5年Python开发经验的软件工程师",
-            "university": "清华大学",
-            "degree": "本科",
-            "major": "计算机科学与技术",
-            "education_start_date": "2015-09",
-            "education_end_date": "2019-07",
-            "current_company": "阿里巴巴",
-            "current_position": "Python开发工程师",
-            "work_start_date": "2019-07",
-            "work_end_date": "2024-01",
-            "responsibilities": "开发Web应用，优化数据库性能",
-            "achievements": "提升系统性能30%",
-            "programming_languages": "Python",
-            "frameworks": "Django"
-        }
-    }
-
-    response = api_request("POST", "resumes", data, token)
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code in [200, 201]:
-        resume_id = response.json().get("id")
+        resume_id = content.get("id")
         print(f"✅ 简历创建成功: ID={resume_id}")
         return resume_id
     else:
@@ -186,15 +230,14 @@ def test_create_resume(token):
         return None
 
 
-def test_get_resumes(token):
+async def test_get_resumes(token):
     """测试获取简历列表"""
+    response = await api_request("GET", "resumes", token=token)
     print_header("测试获取简历列表")
-
-    response = api_request("GET", "resumes", token=token)
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        resumes = response.json()
+        resumes = content
         print(f"✅ 获取简历列表成功: 数量={len(resumes)}")
         return resumes
     else:
@@ -202,15 +245,14 @@ def test_get_resumes(token):
         return []
 
 
-def test_get_resume(token, resume_id):
+async def test_get_resume(token, resume_id):
     """测试获取简历详情"""
+    response = await api_request("GET", f"resumes/{resume_id}", token=token)
     print_header("测试获取简历详情")
-
-    response = api_request("GET", f"resumes/{resume_id}", token=token)
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        resume = response.json()
+        resume = content
         print(f"✅ 获取简历详情成功: 标题={resume.get('title')}")
         return resume
     else:
@@ -218,54 +260,20 @@ def test_get_resume(token, resume_id):
         return None
 
 
-def test_match_fields(token, resume_id):
+async def test_match_fields(token, resume_id):
     """测试字段匹配"""
-    print_header("测试字段匹配API")
-
-    # 表单字段
-    form_fields = [
-        {
-            "name": "fullName",
-            "type": "text",
-            "label": "姓名",
-            "placeholder": "请输入您的姓名"
-        },
-        {
-            "name": "email",
-            "type": "email",
-            "label": "邮箱",
-            "placeholder": "请输入邮箱地址"
-        },
-        {
-            "name": "phone",
-            "type": "tel",
-            "label": "联系电话"
-        },
-        {
-            "name": "education",
-            "type": "select",
-            "label": "学历",
-            "options": ["高中", "大专", "本科", "硕士", "博士"]
-        },
-        {
-            "name": "workYears",
-            "type": "select",
-            "label": "工作年限",
-            "options": ["应届毕业生", "1-3年", "3-5年", "5-10年", "10年以上"]
-        }
-    ]
-
     data = {
         "resume_id": resume_id,
-        "form_fields": form_fields,
+        "form_fields": TEST_FORM_FIELDS,
         "website_url": "https://jobs.example.com"
     }
 
-    response = api_request("POST", "matching/match-fields", data, token)
-    print_response(response)
+    response = await api_request("POST", "matching/match-fields", data, token)
+    print_header("测试字段匹配API")
+    content = print_response(response)
 
     if response.status_code == 200:
-        result = response.json()
+        result = content
         matches = result.get("matches", [])
         print(f"✅ 字段匹配成功: 匹配数量={len(matches)}")
 
@@ -279,15 +287,14 @@ def test_match_fields(token, resume_id):
         return []
 
 
-def test_get_match_stats(token):
+async def test_get_match_stats(token):
     """测试获取匹配统计"""
+    response = await api_request("GET", "matching/match-stats", token=token)
     print_header("测试获取匹配统计")
-
-    response = api_request("GET", "matching/match-stats", token=token)
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        stats = response.json()
+        stats = content
         print(f"✅ 获取匹配统计成功")
         print(f"  - 总使用次数: {stats.get('total_uses', 0)}")
         print(f"  - 总字段数: {stats.get('total_fields', 0)}")
@@ -299,15 +306,14 @@ def test_get_match_stats(token):
         return None
 
 
-def test_get_supported_field_types():
+async def test_get_supported_field_types():
     """测试获取支持的字段类型"""
+    response = await api_request("GET", "matching/supported-field-types")
     print_header("测试获取支持的字段类型")
-
-    response = api_request("GET", "matching/supported-field-types")
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        field_types = response.json().get("field_types", [])
+        field_types = content.get("field_types", [])
         print(f"✅ 获取支持的字段类型成功: 数量={len(field_types)}")
         return field_types
     else:
@@ -315,20 +321,19 @@ def test_get_supported_field_types():
         return []
 
 
-def test_update_resume_fields(token, resume_id):
+async def test_update_resume_fields(token, resume_id):
     """测试更新简历字段"""
-    print_header("测试更新简历字段")
-
     data = {
         "skills": "Python, Django, FastAPI, Vue.js",
         "hobby": "阅读, 旅行, 编程"
     }
 
-    response = api_request("PATCH", f"resumes/{resume_id}/fields", data, token)
-    print_response(response)
+    response = await api_request("PATCH", f"resumes/{resume_id}/fields", data, token)
+    print_header("测试更新简历字段")
+    content = print_response(response)
 
     if response.status_code == 200:
-        updated_resume = response.json()
+        updated_resume = content
         print(f"✅ 更新简历字段成功")
         return updated_resume
     else:
@@ -336,11 +341,10 @@ def test_update_resume_fields(token, resume_id):
         return None
 
 
-def test_delete_resume_field(token, resume_id, field_key):
+async def test_delete_resume_field(token, resume_id, field_key):
     """测试删除简历字段"""
+    response = await api_request("DELETE", f"resumes/{resume_id}/fields/{field_key}", token=token)
     print_header(f"测试删除简历字段: {field_key}")
-
-    response = api_request("DELETE", f"resumes/{resume_id}/fields/{field_key}", token=token)
     print_response(response)
 
     if response.status_code == 200:
@@ -351,15 +355,14 @@ def test_delete_resume_field(token, resume_id, field_key):
         return False
 
 
-def test_get_resume_fields_by_category(token, resume_id):
+async def test_get_resume_fields_by_category(token, resume_id):
     """测试按分类获取简历字段"""
+    response = await api_request("GET", f"resumes/{resume_id}/categories", token=token)
     print_header("测试按分类获取简历字段")
-
-    response = api_request("GET", f"resumes/{resume_id}/categories", token=token)
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        categories = response.json()
+        categories = content
         print(f"✅ 按分类获取简历字段成功: 分类数量={len(categories)}")
         return categories
     else:
@@ -367,15 +370,14 @@ def test_get_resume_fields_by_category(token, resume_id):
         return None
 
 
-def test_get_preset_fields():
+async def test_get_preset_fields():
     """测试获取预设字段模板"""
+    response = await api_request("GET", "resumes/templates/preset-fields")
     print_header("测试获取预设字段模板")
-
-    response = api_request("GET", "resumes/templates/preset-fields")
-    print_response(response)
+    content = print_response(response)
 
     if response.status_code == 200:
-        result = response.json()
+        result = content
         all_fields = result.get("all_fields", [])
         categories = result.get("categories", [])
         print(f"✅ 获取预设字段模板成功: 字段数量={len(all_fields)}, 分类数量={len(categories)}")
@@ -385,11 +387,10 @@ def test_get_preset_fields():
         return None
 
 
-def test_delete_resume(token, resume_id):
+async def test_delete_resume(token, resume_id):
     """测试删除简历"""
+    response = await api_request("DELETE", f"resumes/{resume_id}", token=token)
     print_header("测试删除简历")
-
-    response = api_request("DELETE", f"resumes/{resume_id}", token=token)
     print_response(response)
 
     if response.status_code in [200, 204]:
@@ -400,54 +401,61 @@ def test_delete_resume(token, resume_id):
         return False
 
 
-def main():
+async def main():
     """主测试函数"""
-    print("\n🧪 开始API接口测试...\n")
+    global HTTP_CLIENT
 
-    # 测试用户注册和登录
-    email = test_register_user()
-    if not email:
-        email = "apitest@example.com"  # 使用已存在的测试账号
-
-    token = test_login(email)
-    if not token:
-        print("❌ 无法获取访问令牌，测试终止")
-        return
-
-    # 测试激活码和激活
-    code = test_create_activation_code(token)
-    if code:
-        test_activate_user(token, code)
-
-    # 测试简历管理
-    resume_id = test_create_resume(token)
-    if not resume_id:
-        print("❌ 无法创建简历，跳过相关测试")
-        return
-
-    test_get_resumes(token)
-    test_get_resume(token, resume_id)
-
-    # 测试字段匹配
-    test_match_fields(token, resume_id)
-    test_get_match_stats(token)
+    print("\n🧪 开始API接口测试...\n")
 
-    # 测试支持的字段类型
-    test_get_supported_field_types()
+    # 字段匹配会调用AI，超时时间需放宽
+    async with httpx.AsyncClient(
+        base_url=API_BASE_URL, timeout=60.0, limits=HTTP_LIMITS
+    ) as client:
+        HTTP_CLIENT = client
+
+        # 测试用户注册和登录
+        email = await test_register_user()
+        if not email:
+            email = "apitest@example.com"  # 使用已存在的测试账号
+
+        token = await test_login(email)
+        if not token:
+            print("❌ 无法获取访问令牌，测试终止")
+            return
+
+        # 测试激活码和激活
+        code = await test_create_activation_code(token)
+        if code:
+            await test_activate_user(token, code)
+
+        # 测试简历管理
+        resume_id = await test_create_resume(token)
+        if not resume_id:
+            print("❌ 无法创建简历，跳过相关测试")
+            return
+
+        # 以下只读接口互不依赖，并发执行
+        await asyncio.gather(
+            test_get_resumes(token),
+            test_get_resume(token, resume_id),
+            test_get_supported_field_types(),
+            test_get_preset_fields()
+        )
 
-    # 测试简历字段操作
-    test_update_resume_fields(token, resume_id)
-    test_get_resume_fields_by_category(token, resume_id)
-    test_delete_resume_field(token, resume_id, "hobby")
+        # 测试字段匹配
+        await test_match_fields(token, resume_id)
+        await test_get_match_stats(token)
 
-    # 测试预设字段模板
-    test_get_preset_fields()
+        # 测试简历字段操作
+        await test_update_resume_fields(token, resume_id)
+        await test_get_resume_fields_by_category(token, resume_id)
+        await test_delete_resume_field(token, resume_id, "hobby")
 
-    # 测试删除简历
-    test_delete_resume(token, resume_id)
+        # 测试删除简历
+        await test_delete_resume(token, resume_id)
 
     print("\n🎉 API接口测试完成！")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
\ No newline at end of file